@@ -21,15 +21,45 @@ Notes:
 from __future__ import annotations
 import argparse
 import csv
+import itertools
 import os
-from pathlib import Path
+
+from src.rawio import RawFileWriter
+
+# Keep it conservative for filesystem safety
+_SANITIZE_TABLE = str.maketrans({c: "_" for c in '<>:"/\\|?* \t'})
 
 def sanitize_filename(s: str) -> str:
-    # Keep it conservative for filesystem safety
-    bad = '<>:"/\\|?* \t'
-    out = "".join(ch if ch not in bad else "_" for ch in s)
     # limit length a bit
-    return out[:80] if len(out) > 80 else out
+    return s.translate(_SANITIZE_TABLE)[:80]
+
+def _column_index(header_index: dict[str, int], *names: str) -> int:
+    # Resolve a column by name (case-insensitive); -1 if absent
+    for name in names:
+        i = header_index.get(name.lower(), -1)
+        if i >= 0:
+            return i
+    return -1
+
+def _build_header(genome: str, bam: str | None, snapshot_dir: str | None) -> bytes:
+    # Script preamble, encoded once and written in a single call
+    lines = ["new", f"genome {genome}"]
+    # If a single BAM is provided, load once
+    if bam:
+        lines.append(f"load {bam}")
+    # If snapshots requested, set directory
+    if snapshot_dir:
+        lines.append(f"snapshotDirectory {snapshot_dir}")
+    # Optionally sort and collapse tracks to a tidy view
+    # (You can adjust or remove these lines to taste)
+    # lines.append("sort base")
+    # lines.append("collapse")
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+_ROW_TEMPLATE = "goto {}:{}-{}\n"
+_ROW_TEMPLATE_SNAP = "goto {}:{}-{}\nsnapshot {}\n"
+# Rows are joined and handed to the writer in batches of this many
+_ROW_BATCH = 4096
 
 def make_igv_batch(
     csv_path: str,
@@ -44,67 +74,83 @@ def make_igv_batch(
     """
     Returns number of loci written.
     """
-    out_lines: list[str] = []
-    out_lines.append(f"new")
-    out_lines.append(f"genome {genome}")
-
-    rows = list(csv.DictReader(open(csv_path, newline="")))
-    if not rows:
-        Path(out_path).write_text("\n".join(out_lines) + "\n")
-        return 0
-
-    # If a single BAM is provided, load once
-    if bam:
-        out_lines.append(f"load {bam}")
-
-    # If snapshots requested, set directory
-    if snapshot_dir:
-        out_lines.append(f"snapshotDirectory {snapshot_dir}")
-
-    count = 0
-    for r in rows:
-        chrom = (r.get("chrom") or r.get("CHROM") or "").strip()
-        pos_str = (r.get("pos") or r.get("POS") or "").strip()
-        if not chrom or not pos_str.isdigit():
-            # skip malformed line
-            continue
-        pos = int(pos_str)
-        start = max(1, pos - flank)
-        end = pos + flank
-
-        # If BAM per row: load it before goto (IGV tolerates multiple loads)
-        row_bam_path = None
+    with open(csv_path, newline="") as cf, RawFileWriter(out_path) as fh:
+        reader = csv.reader(cf)
+
+        # csv.reader yields [] for blank lines; DictReader used to skip them
+        header = next((r for r in reader if r), None)
+        first = next((r for r in reader if r), None)
+        if header is None or first is None:
+            # no loci: bare new/genome preamble
+            fh.write_bytes(_build_header(genome, None, None))
+            return 0
+
+        # Resolve column positions once instead of per-row dict lookups
+        header_index: dict[str, int] = {}
+        for i, name in enumerate(header):
+            header_index.setdefault(name.strip().lower(), i)
+        i_chrom = _column_index(header_index, "chrom")
+        i_pos = _column_index(header_index, "pos")
+        i_gene = _column_index(header_index, "gene")
+        i_cons = _column_index(header_index, "consequence", "consequences")
+        i_bam = -1
         if bam_col:
-            row_bam_path = (r.get(bam_col) or "").strip()
-            if row_bam_path:
-                out_lines.append(f"load {row_bam_path}")
-
-        out_lines.append(f"goto {chrom}:{start}-{end}")
-
-        # Create a snapshot line if requested
-        if snapshot_dir is not None:
-            gene = (r.get("gene") or r.get("GENE") or "").strip()
-            consequence = (r.get("consequence") or r.get("Consequences") or r.get("CONSEQUENCE") or "").strip()
-            label_parts = [chrom, str(pos)]
-            if gene:
-                label_parts.append(gene)
-            if consequence:
-                # keep short
-                label_parts.append(consequence.split("&")[0][:24])
-            base_name = "_".join(label_parts)
-            if snapshot_prefix:
-                base_name = f"{snapshot_prefix}_{base_name}"
-            fname = sanitize_filename(base_name) + ".png"
-            out_lines.append(f"snapshot {fname}")
-
-        count += 1
-
-    # Optionally sort and collapse tracks to a tidy view
-    # (You can adjust or remove these lines to taste)
-    # out_lines.insert(2, "sort base")
-    # out_lines.insert(3, "collapse")
+            i_bam = header.index(bam_col) if bam_col in header else _column_index(header_index, bam_col)
+        width = max(i_chrom, i_pos, i_gene, i_cons, i_bam) + 1
+
+        fh.write_bytes(_build_header(genome, bam, snapshot_dir))
+
+        count = 0
+        if i_chrom < 0 or i_pos < 0:
+            # no locus columns: nothing to navigate to
+            return count
+
+        pending: list[str] = []
+        for row in itertools.chain((first,), reader):
+            if len(row) < width:
+                # short row: pad like DictReader's restval
+                row = row + [""] * (width - len(row))
+            chrom = row[i_chrom].strip()
+            pos_str = row[i_pos].strip()
+            if not chrom or not pos_str.isdigit():
+                # skip malformed line
+                continue
+            pos = int(pos_str)
+            start = max(1, pos - flank)
+            end = pos + flank
+
+            # If BAM per row: load it before goto (IGV tolerates multiple loads)
+            if i_bam >= 0:
+                row_bam_path = row[i_bam].strip()
+                if row_bam_path:
+                    pending.append(f"load {row_bam_path}\n")
+
+            # Create a snapshot line if requested
+            if snapshot_dir is None:
+                pending.append(_ROW_TEMPLATE.format(chrom, start, end))
+            else:
+                gene = row[i_gene].strip() if i_gene >= 0 else ""
+                consequence = row[i_cons].strip() if i_cons >= 0 else ""
+                label_parts = [chrom, str(pos)]
+                if gene:
+                    label_parts.append(gene)
+                if consequence:
+                    # keep short
+                    label_parts.append(consequence.split("&")[0][:24])
+                base_name = "_".join(label_parts)
+                if snapshot_prefix:
+                    base_name = f"{snapshot_prefix}_{base_name}"
+                fname = sanitize_filename(base_name) + ".png"
+                pending.append(_ROW_TEMPLATE_SNAP.format(chrom, start, end, fname))
+
+            count += 1
+            if len(pending) >= _ROW_BATCH:
+                fh.write("".join(pending))
+                pending.clear()
+
+        if pending:
+            fh.write("".join(pending))
 
-    Path(out_path).write_text("\n".join(out_lines) + "\n")
     return count
 
 def main():
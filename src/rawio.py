@@ -0,0 +1,58 @@
+"""
+Minimal buffered writer over a raw file descriptor.
+
+Text is encoded once per write() into a bytearray and flushed with os.write
+once the buffer passes a threshold, skipping the TextIOWrapper/BufferedWriter
+layers. Exposes write(str) so it can also back csv.writer.
+"""
+
+from __future__ import annotations
+import os
+
+DEFAULT_THRESHOLD = 256 * 1024
+
+
+class RawFileWriter:
+    """Write-only, truncating file handle: fd + bytearray buffer."""
+
+    def __init__(self, path: str, threshold: int = DEFAULT_THRESHOLD, encoding: str = "utf-8"):
+        self._fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        self._buf = bytearray()
+        self._threshold = threshold
+        self._encoding = encoding
+
+    def write(self, s: str) -> int:
+        self._buf += s.encode(self._encoding)
+        if len(self._buf) >= self._threshold:
+            self.flush()
+        return len(s)
+
+    def write_bytes(self, b: bytes) -> int:
+        self._buf += b
+        if len(self._buf) >= self._threshold:
+            self.flush()
+        return len(b)
+
+    def flush(self) -> None:
+        view = memoryview(self._buf)
+        while view:
+            # os.write may be partial; keep going until the buffer is drained
+            n = os.write(self._fd, view)
+            view = view[n:]
+        view.release()
+        self._buf.clear()
+
+    def close(self) -> None:
+        if self._fd < 0:
+            return
+        try:
+            self.flush()
+        finally:
+            os.close(self._fd)
+            self._fd = -1
+
+    def __enter__(self) -> "RawFileWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -17,16 +17,123 @@ Usage:
 """
 
 import argparse
+import contextlib
 import csv
 import gzip
 import io
-import re
-from typing import Dict, Iterator, Optional, Set, Tuple
+import mmap
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+from collections import Counter
+from typing import AbstractSet, AnyStr, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from src.rawio import RawFileWriter
+
+
+# BGZF = gzip member with the "BC" extra subfield (SAM/VCF spec, as written by bgzip)
+_BGZF_MAGIC = b"\x1f\x8b\x08\x04"
+
+
+def is_bgzf(path: str) -> bool:
+    """True if path starts with a BGZF (bgzip) block header rather than plain gzip."""
+    with open(path, "rb") as fh:
+        head = fh.read(18)
+    return len(head) == 18 and head[:4] == _BGZF_MAGIC and head[12:14] == b"BC"
+
+
+def open_gzip_auto(path: str):
+    """
+    Open a .gz file as a binary handle.
+    bgzipped input is decoded by htslib via pysam when it is installed (much faster than gzip);
+    plain gzip, or no pysam, uses the stdlib gzip module.
+    """
+    if is_bgzf(path):
+        try:
+            import pysam
+        except ImportError:
+            pass
+        else:
+            return pysam.BGZFile(str(path), "rb")
+    return gzip.open(path, "rb")
 
 
 def open_text_auto(path: str):
-    """Open plain text or gzipped text as a text file-handle."""
-    return io.TextIOWrapper(gzip.open(path, "rb")) if str(path).endswith(".gz") else open(path, "r", encoding="utf-8")
+    """
+    Open plain text or gzipped text as a text file-handle.
+    Not used by the triage path (which reads bytes via open_lines_auto); kept as public API for callers.
+    """
+    return io.TextIOWrapper(open_gzip_auto(path)) if str(path).endswith(".gz") else open(path, "r", encoding="utf-8")
+
+
+def open_write_auto(path: str):
+    """
+    Open an output text handle, compressing inline by extension:
+    .zst -> zstandard (optional dependency; multi-threaded), .gz -> gzip level 1, else RawFileWriter.
+    Newlines are written untranslated (CSV rows carry their own "\r\n").
+    """
+    path = str(path)
+    if path.endswith(".zst"):
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError("writing .zst output needs the 'zstandard' package (pip install zstandard)") from e
+        # threads=-1: compress on all cores, off the triage loop's critical path
+        raw = zstandard.ZstdCompressor(level=3, threads=-1).stream_writer(open(path, "wb"))
+        return io.TextIOWrapper(raw, encoding="utf-8", newline="")
+    if path.endswith(".gz"):
+        # level 1 is several times faster than the default 9 for most of the size reduction
+        return gzip.open(path, "wt", compresslevel=1, encoding="utf-8", newline="")
+    return RawFileWriter(path)
+
+
+def _iter_mmap_lines(mm: mmap.mmap, lo: int, hi: int) -> Iterator[bytes]:
+    """bytes lines (newline kept) of mm[lo:hi]; hi must sit on a line boundary."""
+    find = mm.find
+    pos = lo
+    while pos < hi:
+        nl = find(b"\n", pos, hi)
+        end = hi if nl < 0 else nl + 1
+        yield mm[pos:end]
+        pos = end
+
+
+def _iter_stream_lines(fh, chunk_size: int = 1 << 20) -> Iterator[bytes]:
+    """
+    bytes lines (newline stripped) read in fixed-size blocks until real EOF.
+    Used instead of iter(fh): pysam's BGZFile iterator strips newlines and stops at the first blank line.
+    """
+    tail = b""
+    while True:
+        block = fh.read(chunk_size)
+        if not block:
+            break
+        lines = (tail + block).split(b"\n")
+        tail = lines.pop()
+        yield from lines
+    if tail:
+        yield tail
+
+
+@contextlib.contextmanager
+def open_lines_auto(path: str) -> Iterator[Iterator[bytes]]:
+    """
+    Context manager giving an iterator of raw bytes lines.
+    Plain files are memory-mapped (no TextIOWrapper decode/line machinery); .gz goes through open_gzip_auto.
+    """
+    if str(path).endswith(".gz"):
+        with open_gzip_auto(path) as fh:
+            yield _iter_stream_lines(fh)
+        return
+    with open(path, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            # mmap refuses empty files
+            yield iter(())
+            return
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield _iter_mmap_lines(mm, 0, len(mm))
 
 
 def parse_info(s: str) -> Dict[str, str]:
@@ -43,71 +150,293 @@ def parse_info(s: str) -> Dict[str, str]:
     return out
 
 
+def info_value(info: AnyStr, key: AnyStr) -> Optional[AnyStr]:
+    """Value of key=... in a raw INFO string (str or bytes), without splitting it (None if absent)."""
+    eq, semi = ("=", ";") if isinstance(info, str) else (b"=", b";")
+    tag = key + eq
+    if info.startswith(tag):
+        start = len(tag)
+    else:
+        # anchor on ";" so e.g. MAX_AF= never matches AF=
+        i = info.find(semi + tag)
+        if i < 0:
+            return None
+        start = i + 1 + len(tag)
+    end = info.find(semi, start)
+    return info[start:] if end < 0 else info[start:end]
+
+
+def extract_af_ann(info: Union[str, bytes]) -> Tuple[Optional[str], str]:
+    """AF (None if absent) and ANN ("" if absent) straight from the raw INFO field."""
+    if isinstance(info, str):
+        return info_value(info, "AF"), info_value(info, "ANN") or ""
+    # bytes INFO (from simple_vcf_iter): only the two extracted values are ever decoded
+    af = info_value(info, b"AF")
+    ann = info_value(info, b"ANN")
+    return (af.decode() if af is not None else None), (ann.decode() if ann else "")
+
+
+_NO_ANN: Tuple[str, str, str, str] = ("", "", "", "")
+
+
 def parse_ann(info: Dict[str, str]) -> Tuple[str, str, str, str]:
     """
     Parse the first VEP ANN record.
     Typical order: Allele|Consequence|IMPACT|SYMBOL|Gene|Feature_type|Feature|...|HGVSc|HGVSp
     """
-    ann = info.get("ANN", "")
+    return parse_ann_value(info.get("ANN", ""))
+
+
+def parse_ann_value(ann: str) -> Tuple[str, str, str, str]:
+    """Like parse_ann, but takes the raw ANN string; splits only as far as HGVSp (field 10)."""
     if not ann:
-        return "", "", "", ""
-    first = ann.split(",")[0]
-    parts = first.split("|")
-    gene = parts[3] if len(parts) > 3 else ""
-    consequence = parts[1] if len(parts) > 1 else ""
-    hgvsc = parts[9] if len(parts) > 9 else ""
-    hgvsp = parts[10] if len(parts) > 10 else ""
+        return _NO_ANN
+    first = ann.partition(",")[0]
+    parts = first.split("|", 11)
+    n = len(parts)
+    gene = parts[3] if n > 3 else ""
+    consequence = parts[1] if n > 1 else ""
+    hgvsc = parts[9] if n > 9 else ""
+    hgvsp = parts[10] if n > 10 else ""
     return gene, consequence, hgvsc, hgvsp
 
 
+def ann_gene(ann: str) -> str:
+    """Gene symbol (field 3) of the first ANN record, without parsing the rest."""
+    parts = ann.partition(",")[0].split("|", 4)
+    return parts[3] if len(parts) > 3 else ""
+
+
+def format_index(fmt_keys: List[str], key: str) -> int:
+    """Position of key in a split FORMAT column, or -1 (a list scan beats hashing for <10 keys)."""
+    return fmt_keys.index(key) if key in fmt_keys else -1
+
+
 def allele_balance(fmt_map: Dict[str, str]) -> Optional[float]:
     """Compute AB = alt/(ref+alt) from AD if present."""
-    ad = fmt_map.get("AD")
+    return allele_balance_ad(fmt_map.get("AD"))
+
+
+def allele_balance_ad(ad: Optional[str]) -> Optional[float]:
+    """allele_balance from the raw AD value ("ref,alt,...")."""
     if not ad:
         return None
+    # two C-level partitions instead of split + slice + list comprehension
+    ref_s, sep, rest = ad.partition(",")
+    if not sep:
+        return None
+    alt_s = rest.partition(",")[0]
     try:
-        ref, alt = [int(x) for x in ad.split(",")[:2]]
-        tot = ref + alt
-        return round(alt / tot, 3) if tot else None
-    except Exception:
+        ref = int(ref_s)
+        alt = int(alt_s)
+    except ValueError:
+        # e.g. AD=".,." on a no-call
         return None
+    tot = ref + alt
+    return round(alt / tot, 3) if tot else None
 
 
-def simple_vcf_iter(path: str) -> Iterator[Dict[str, object]]:
-    """Tiny single-sample VCF iterator. Accepts tab OR space-delimited toy files."""
-    with open_text_auto(path) as fh:
-        for line in fh:
-            if line.startswith("##"):
-                continue
-            if line.startswith("#CHROM"):
-                # header split on any whitespace to be robust to toy files
-                _header = re.split(r"\s+", line.strip())
-                continue
-            if not line.strip():
-                continue
-            # data line
-            fields = re.split(r"\s+", line.strip())
-            if len(fields) < 8:
-                # skip malformed lines
+def simple_vcf_iter(
+    path: str,
+    pass_only: bool = False,
+    min_qual: Optional[float] = None,
+) -> Iterator[Dict[str, object]]:
+    """
+    Tiny single-sample VCF iterator. Accepts tab OR space-delimited toy files.
+    pass_only / min_qual drop records on the raw FILTER/QUAL columns.
+    INFO is yielded as raw bytes ("INFO_RAW") and FORMAT/sample as ("FORMAT_RAW" = (format, sample));
+    callers pull out only the keys they need.
+    """
+    with open_lines_auto(path) as lines:
+        yield from parse_vcf_lines(lines, pass_only, min_qual)
+
+
+def parse_vcf_lines(
+    lines: Iterable[bytes],
+    pass_only: bool = False,
+    min_qual: Optional[float] = None,
+) -> Iterator[Dict[str, object]]:
+    """
+    Record parser behind simple_vcf_iter; takes any iterable of bytes VCF lines (e.g. one parallel chunk).
+    Works on bytes and decodes only the columns it yields; INFO stays bytes.
+    """
+    tab_delimited: Optional[bool] = None
+    for line in lines:
+        if line.startswith(b"#"):
+            # ## meta lines and the #CHROM header
+            continue
+        if not line.strip():
+            continue
+        # data line; decide once whether the file is real TSV or a toy file
+        if tab_delimited is None:
+            tab_delimited = b"\t" in line
+        if tab_delimited:
+            # maxsplit stops after the first sample column (extra samples are ignored)
+            fields = line.rstrip(b"\r\n").split(b"\t", 10)
+        else:
+            fields = line.split()
+        if len(fields) < 8:
+            # skip malformed lines
+            continue
+        chrom, pos, _id, ref, alt, qual_s, flt_b, info = fields[:8]
+        flt = "PASS" if flt_b == b"." else flt_b.decode()
+        if pass_only and flt != "PASS":
+            continue
+        # int()/float() accept ASCII bytes directly
+        qual = None if qual_s in (b".", b"") else float(qual_s)
+        if min_qual is not None and (qual or 0.0) < min_qual:
+            continue
+        fmt = fields[8].decode() if len(fields) > 8 else ""
+        sample = fields[9].decode() if len(fields) > 9 else ""
+        yield {
+            "CHROM": chrom.decode(),
+            "POS": int(pos),
+            "REF": ref.decode(),
+            "ALT": alt.decode().split(","),  # list
+            "QUAL": qual,
+            "FILTER": flt,
+            "INFO_RAW": info,
+            "FORMAT_RAW": (fmt, sample),
+        }
+
+TRIAGE_COLUMNS = ["chrom", "pos", "ref", "alt", "gene", "consequence", "hgvs_c", "hgvs_p", "af", "gt", "dp", "ab", "filters"]
+
+# Fast-path row formatter for the fixed schema; "\r\n" matches csv.writer's default dialect.
+# A row is prefix + ALT + suffix, so multi-allelic records format the shared fields once.
+_ALT_COL = TRIAGE_COLUMNS.index("alt")
+_ROW_PREFIX = "{}," * _ALT_COL
+_ROW_SUFFIX = ",{}" * (len(TRIAGE_COLUMNS) - _ALT_COL - 1) + "\r\n"
+_PREFIX_SEPS = _ROW_PREFIX.count(",")
+_SUFFIX_SEPS = _ROW_SUFFIX.count(",")
+CSV_HEADER = ",".join(TRIAGE_COLUMNS) + "\r\n"
+
+
+def format_row_parts(before_alt: Tuple[object, ...], after_alt: Tuple[object, ...]) -> Optional[Tuple[str, str]]:
+    """
+    CSV text on either side of the ALT column for one record,
+    or None if any shared field would need csv quoting.
+    """
+    prefix = _ROW_PREFIX.format(*before_alt)
+    suffix = _ROW_SUFFIX.format(*after_alt)
+    # One scan per special char per part instead of per-field checks
+    if (
+        '"' in prefix
+        or '"' in suffix
+        or prefix.count(",") != _PREFIX_SEPS
+        or suffix.count(",") != _SUFFIX_SEPS
+        or "\n" in prefix
+        or "\r" in prefix
+        or suffix.count("\n") != 1
+        or suffix.count("\r") != 1
+    ):
+        return None
+    return prefix, suffix
+
+
+def triage_records(
+    records: Iterable[Dict[str, object]],
+    f,
+    min_dp: int = 10,
+    max_af: float = 0.01,
+    genes_set: Optional[AbstractSet[str]] = None,
+) -> Tuple[int, Dict[str, int]]:
+    """
+    Apply the post-iterator filters and write kept rows (no header) to text handle f.
+    FILTER/QUAL are expected to be pushed down into the iterator already.
+    Returns (kept, by_consequence).
+    """
+    kept = 0
+    by_consequence: Counter[str] = Counter()
+    if genes_set is not None:
+        genes_set = frozenset(genes_set)
+
+    # csv.writer is only the slow path for rows format_row_parts can't emit verbatim
+    w = csv.writer(f)
+    # Bind hot-loop callables to locals (saves attribute/global lookups per record)
+    write = f.write
+    writerow = w.writerow
+    row_parts = format_row_parts
+    row_buf: List[object] = [None] * len(TRIAGE_COLUMNS)
+    ab_of = allele_balance_ad
+    first_ann = parse_ann_value
+    af_ann = extract_af_ann
+    # FORMAT key positions, cached per FORMAT layout
+    last_fmt: Optional[str] = None
+    i_gt = i_dp = i_ad = -1
+
+    for rec in records:
+        flt: str = rec["FILTER"]  # type: ignore
+
+        af_raw, ann = af_ann(rec["INFO_RAW"])  # type: ignore
+        af = float(af_raw) if af_raw not in (None, "") else None
+        if af is not None and af >= max_af:
+            continue
+
+        fmt, sample = rec["FORMAT_RAW"]  # type: ignore
+        if fmt != last_fmt:
+            # FORMAT is usually identical on every record: resolve key positions once per layout
+            keys = fmt.split(":")
+            i_gt, i_dp, i_ad = format_index(keys, "GT"), format_index(keys, "DP"), format_index(keys, "AD")
+            last_fmt = fmt
+        vals = sample.split(":") if fmt and sample else []
+        nvals = len(vals)
+
+        dp = int((vals[i_dp] if 0 <= i_dp < nvals else "") or 0)
+        if dp < min_dp:
+            continue
+
+        gt = vals[i_gt] if 0 <= i_gt < nvals else ""
+        ab = ab_of(vals[i_ad] if 0 <= i_ad < nvals else None)
+        if gt in ("0/1", "1/0") and ab is not None and not (0.3 <= ab <= 0.7):
+            continue
+
+        # Gene allowlist—keep only if gene in provided set (checked before the full ANN parse)
+        if genes_set is not None:
+            gene = ann_gene(ann) if ann else ""
+            if not gene or gene not in genes_set:
                 continue
-            chrom, pos, _id, ref, alt, qual, flt, info = fields[:8]
-            fmt = fields[8] if len(fields) > 8 else ""
-            sample = fields[9] if len(fields) > 9 else ""
-            fmt_map: Dict[str, str] = {}
-            if fmt and sample:
-                keys = fmt.split(":")
-                vals = sample.split(":")
-                fmt_map = {k: (vals[i] if i < len(vals) else "") for i, k in enumerate(keys)}
-            yield {
-                "CHROM": chrom,
-                "POS": int(pos),
-                "REF": ref,
-                "ALT": alt.split(","),  # list
-                "QUAL": None if qual in (".", "") else float(qual),
-                "FILTER": "PASS" if flt == "." else flt,
-                "INFO": parse_info(info),
-                "FORMAT": fmt_map,
-            }
+
+        gene, consequence, hgvsc, hgvsp = first_ann(ann) if ann else _NO_ANN
+
+        before_alt = (rec["CHROM"], rec["POS"], rec["REF"])
+        after_alt = (
+            gene,
+            consequence,
+            hgvsc,
+            hgvsp,
+            af if af is not None else "",
+            gt,
+            dp,
+            ab if ab is not None else "",
+            flt,
+        )
+        parts = row_parts(before_alt, after_alt)
+
+        for alt in rec["ALT"]:  # type: ignore
+            # ALT came from a comma split, so only a quote can force csv quoting here
+            if parts is not None and '"' not in alt:
+                write(parts[0] + alt + parts[1])
+            else:
+                # reuse one list for the slow path; writerow keeps no reference to it
+                row_buf[:_ALT_COL] = before_alt
+                row_buf[_ALT_COL] = alt
+                row_buf[_ALT_COL + 1 :] = after_alt
+                writerow(row_buf)
+            kept += 1
+            if consequence:
+                by_consequence[consequence] += 1
+
+    return kept, by_consequence
+
+
+def write_summary(summary_path: str, kept: int, by_consequence: Dict[str, int]) -> None:
+    with open(summary_path, "w") as s:
+        s.write(f"Kept variants: {kept}\n")
+        if by_consequence:
+            s.write("By consequence:\n")
+            # not most_common(): ties must stay alphabetical
+            for k, v in sorted(by_consequence.items(), key=lambda x: (-x[1], x[0])):
+                s.write(f"  {k}: {v}\n")
 
 
 def triage(
@@ -117,79 +446,119 @@ def triage(
     min_qual: float = 30.0,
     max_af: float = 0.01,
     include_nonpass: bool = False,
-    genes_set: Optional[Set[str]] = None,
+    genes_set: Optional[AbstractSet[str]] = None,
     summary_path: Optional[str] = None,
 ) -> bool:
     """Core filtering + CSV writer (with optional gene allowlist and summary)."""
-    cols = ["chrom", "pos", "ref", "alt", "gene", "consequence", "hgvs_c", "hgvs_p", "af", "gt", "dp", "ab", "filters"]
-    kept = 0
-    by_consequence: Dict[str, int] = {}
+    with open_write_auto(out_csv) as f:
+        f.write(CSV_HEADER)
+        # FILTER/QUAL are pushed down into the iterator so rejected records skip FORMAT parsing
+        records = simple_vcf_iter(vcf_path, pass_only=not include_nonpass, min_qual=min_qual)
+        kept, by_consequence = triage_records(records, f, min_dp, max_af, genes_set)
 
-    with open(out_csv, "w", newline="") as f:
-        w = csv.writer(f)
-        w.writerow(cols)
-
-        for rec in simple_vcf_iter(vcf_path):
-            flt = str(rec["FILTER"])
-            if not include_nonpass and flt != "PASS":
-                continue
-
-            qual = float(rec["QUAL"] or 0.0)
-            if qual < min_qual:
-                continue
+    if summary_path:
+        write_summary(summary_path, kept, by_consequence)
 
-            info = rec["INFO"]  # type: ignore
-            af_raw = info.get("AF")
-            af = float(af_raw) if af_raw not in (None, "") else None
-            if af is not None and af >= max_af:
-                continue
+    return True
 
-            fmt = rec["FORMAT"]  # type: ignore
-            dp = int(fmt.get("DP", 0) or 0)
-            if dp < min_dp:
-                continue
 
-            gt = fmt.get("GT", "")
-            ab = allele_balance(fmt)
-            if gt in ("0/1", "1/0") and ab is not None and not (0.3 <= ab <= 0.7):
-                continue
+# Below this size the process start-up and merge cost more than a single loop
+PARALLEL_MIN_BYTES = 100 * 1024 * 1024
+
+
+def _chunk_bounds(mm: mmap.mmap, workers: int) -> List[Tuple[int, int]]:
+    """Split the data section of a mapped VCF into ~equal byte ranges snapped to line starts."""
+    size = len(mm)
+    start = 0
+    # skip the ## / #CHROM header block
+    while start < size and mm[start:start + 1] == b"#":
+        nl = mm.find(b"\n", start)
+        start = size if nl < 0 else nl + 1
+    span = max(1, (size - start) // workers)
+    bounds: List[Tuple[int, int]] = []
+    lo = start
+    for k in range(1, workers):
+        nl = mm.find(b"\n", max(lo, start + k * span))
+        hi = size if nl < 0 else nl + 1
+        if hi > lo:
+            bounds.append((lo, hi))
+            lo = hi
+    if lo < size:
+        bounds.append((lo, size))
+    return bounds
+
+
+def _triage_chunk(
+    vcf_path: str,
+    lo: int,
+    hi: int,
+    part_csv: str,
+    min_dp: int,
+    min_qual: float,
+    max_af: float,
+    include_nonpass: bool,
+    genes_set: Optional[AbstractSet[str]],
+) -> Tuple[int, Dict[str, int]]:
+    """Pool worker: triage bytes [lo, hi) of vcf_path into part_csv (rows only)."""
+    with open(vcf_path, "rb") as vf, mmap.mmap(vf.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with RawFileWriter(part_csv) as f:
+            lines = _iter_mmap_lines(mm, lo, hi)
+            records = parse_vcf_lines(lines, pass_only=not include_nonpass, min_qual=min_qual)
+            return triage_records(records, f, min_dp, max_af, genes_set)
+
+
+def triage_parallel(
+    vcf_path: str,
+    out_csv: str,
+    workers: Optional[int] = None,
+    min_dp: int = 10,
+    min_qual: float = 30.0,
+    max_af: float = 0.01,
+    include_nonpass: bool = False,
+    genes_set: Optional[AbstractSet[str]] = None,
+    summary_path: Optional[str] = None,
+    min_bytes: int = PARALLEL_MIN_BYTES,
+) -> bool:
+    """
+    triage() split across processes by byte ranges of an uncompressed VCF; output is identical.
+    Falls back to triage() for .gz input, workers <= 1, empty files, or files smaller than min_bytes.
+    """
+    workers = workers or os.cpu_count() or 1
+    serial_args = (vcf_path, out_csv, min_dp, min_qual, max_af, include_nonpass, genes_set, summary_path)
+    size = 0 if str(vcf_path).endswith(".gz") else os.path.getsize(vcf_path)
+    # size == 0 also covers empty files, which mmap refuses
+    if workers <= 1 or size == 0 or size < min_bytes:
+        return triage(*serial_args)
+
+    with open(vcf_path, "rb") as vf, mmap.mmap(vf.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        bounds = _chunk_bounds(mm, workers)
+    if genes_set is not None:
+        genes_set = frozenset(genes_set)
+
+    with tempfile.TemporaryDirectory(prefix="vcf_triage_") as tmp:
+        parts = [os.path.join(tmp, f"part{i:04d}.csv") for i in range(len(bounds))]
+        jobs = [
+            (vcf_path, lo, hi, part, min_dp, min_qual, max_af, include_nonpass, genes_set)
+            for (lo, hi), part in zip(bounds, parts)
+        ]
+        with multiprocessing.Pool(min(workers, len(jobs)) or 1) as pool:
+            results = pool.starmap(_triage_chunk, jobs)
+
+        # parts are rows only, so concatenating them in order after one header reproduces triage()
+        with open_write_auto(out_csv) as out:
+            out.write(CSV_HEADER)
+            for part in parts:
+                with open(part, "r", encoding="utf-8", newline="") as pf:
+                    shutil.copyfileobj(pf, out, 1 << 20)
 
-            gene, consequence, hgvsc, hgvsp = parse_ann(info)  # type: ignore
-
-            # Gene allowlist—keep only if gene in provided set
-            if genes_set is not None:
-                if not gene or gene not in genes_set:
-                    continue
-
-            for alt in rec["ALT"]:  # type: ignore
-                w.writerow(
-                    [
-                        rec["CHROM"],
-                        rec["POS"],
-                        rec["REF"],
-                        alt,
-                        gene,
-                        consequence,
-                        hgvsc,
-                        hgvsp,
-                        af if af is not None else "",
-                        gt,
-                        dp,
-                        ab if ab is not None else "",
-                        flt,
-                    ]
-                )
-                kept += 1
-                if consequence:
-                    by_consequence[consequence] = by_consequence.get(consequence, 0) + 1
+    kept = 0
+    by_consequence: Counter[str] = Counter()
+    for part_kept, part_counts in results:
+        kept += part_kept
+        by_consequence.update(part_counts)
 
     if summary_path:
-        with open(summary_path, "w") as s:
-            s.write(f"Kept variants: {kept}\n")
-            if by_consequence:
-                s.write("By consequence:\n")
-                for k, v in sorted(by_consequence.items(), key=lambda x: (-x[1], x[0])):
-                    s.write(f"  {k}: {v}\n")
+        write_summary(summary_path, kept, by_consequence)
 
     return True
 
@@ -197,19 +566,39 @@ def triage(
 def main():
     ap = argparse.ArgumentParser(description="Filter and summarise a VCF into CSV")
     ap.add_argument("--vcf", required=True, help="Path to input .vcf or .vcf.gz")
-    ap.add_argument("--out", required=True, help="Output CSV path")
+    ap.add_argument("--out", required=True, help="Output CSV path (.gz / .zst to compress inline)")
     ap.add_argument("--min-dp", type=int, default=10, help="Minimum depth (DP) to keep a site")
     ap.add_argument("--min-qual", type=float, default=30.0, help="Minimum QUAL to keep a site")
     ap.add_argument("--max-af", type=float, default=0.01, help="Maximum allele frequency (AF) if present in INFO")
     ap.add_argument("--include-nonpass", action="store_true", help="Include sites where FILTER != PASS")
     ap.add_argument("--genes", help="File of genes to keep (one per line)")
     ap.add_argument("--summary", help="Write a small text summary to this path")
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for large uncompressed VCFs (0 = all CPUs; default 1)",
+    )
     args = ap.parse_args()
 
-    genes_set: Optional[Set[str]] = None
+    genes_set: Optional[AbstractSet[str]] = None
     if args.genes:
         with open(args.genes) as gf:
-            genes_set = {line.strip() for line in gf if line.strip()}
+            genes_set = frozenset(sys.intern(line.strip()) for line in gf if line.strip())
+
+    if args.workers != 1:
+        triage_parallel(
+            args.vcf,
+            args.out,
+            args.workers or None,
+            args.min_dp,
+            args.min_qual,
+            args.max_af,
+            args.include_nonpass,
+            genes_set,
+            args.summary,
+        )
+        return
 
     triage(
         args.vcf,
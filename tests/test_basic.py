@@ -1,5 +1,6 @@
-import csv, pathlib
-from src.vcf_triage import triage
+import csv, gzip, pathlib, struct, sys, zlib
+import pytest
+from src.vcf_triage import is_bgzf, simple_vcf_iter, triage
 
 def test_filters(tmp_path: pathlib.Path):
     out = tmp_path/"out.csv"
@@ -11,3 +12,104 @@ def test_filters(tmp_path: pathlib.Path):
     assert "3000" not in poses  # not PASS
     assert "4000" not in poses  # AF too high
 
+
+def test_tab_delimited(tmp_path: pathlib.Path):
+    vcf = tmp_path/"tabs.vcf"
+    vcf.write_text(
+        "##fileformat=VCFv4.2\n"
+        "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\tFORMAT\tsample1\n"
+        "1\t1000\t.\tA\tG\t50\tPASS\tAF=0.005;ANN=G|missense_variant|MOD|GENE1|||||c.100A>G|p.Lys34Arg\tGT:AD:DP\t0/1:20,18:38\n"
+    )
+    out = tmp_path/"out.csv"
+    triage(str(vcf), str(out), min_dp=10, min_qual=30)
+    rows = list(csv.DictReader(open(out)))
+    assert [(r["pos"], r["gene"], r["dp"]) for r in rows] == [("1000", "GENE1", "38")]
+
+def test_quoted_fields_fall_back_to_csv_writer(tmp_path: pathlib.Path):
+    vcf = tmp_path/"quote.vcf"
+    vcf.write_text(
+        "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\tFORMAT\tsample1\n"
+        "1\t1000\t.\tA\tG\t50\tlow\"q\tANN=G|missense_variant|MOD|GENE1\tGT:AD:DP\t1/1:0,30:30\n"
+        "1\t1100\t.\tC\tT\t50\tPASS\tANN=T|missense_variant|MOD|GENE1\tGT:AD:DP\t1/1:0,30:30\n"
+    )
+    out = tmp_path/"out.csv"
+    triage(str(vcf), str(out), include_nonpass=True)
+    rows = list(csv.DictReader(open(out, newline="")))
+    assert [r["filters"] for r in rows] == ['low"q', "PASS"]
+
+def test_af_not_confused_with_other_info_keys(tmp_path: pathlib.Path):
+    vcf = tmp_path/"maxaf.vcf"
+    vcf.write_text(
+        "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\tFORMAT\tsample1\n"
+        "1\t1000\t.\tA\tG\t50\tPASS\tMAX_AF=0.9;AF=0.001;XANN=x;ANN=G|missense_variant|MOD|GENE1\tGT:DP\t1/1:30\n"
+        "1\t2000\t.\tA\tG\t50\tPASS\tMAX_AF=0.001;AF=0.5\tGT:DP\t1/1:30\n"
+    )
+    out = tmp_path/"out.csv"
+    triage(str(vcf), str(out))
+    rows = list(csv.DictReader(open(out)))
+    assert [(r["pos"], r["af"], r["gene"]) for r in rows] == [("1000", "0.001", "GENE1")]
+
+def test_gzipped_input(tmp_path: pathlib.Path):
+    vcf_gz = tmp_path/"sample.vcf.gz"
+    with open("data/sample.vcf", "rb") as src, gzip.open(vcf_gz, "wb") as dst:
+        dst.write(src.read())
+    out = tmp_path/"out.csv"
+    triage(str(vcf_gz), str(out), min_dp=10, min_qual=30)
+    rows = list(csv.DictReader(open(out)))
+    assert {r["pos"] for r in rows} == {"1000"}
+
+def test_gzipped_output(tmp_path: pathlib.Path):
+    plain, packed = tmp_path/"out.csv", tmp_path/"out.csv.gz"
+    triage("data/sample.vcf", str(plain), min_dp=10, min_qual=30)
+    triage("data/sample.vcf", str(packed), min_dp=10, min_qual=30)
+    with gzip.open(packed, "rb") as fh:
+        assert fh.read() == plain.read_bytes()
+
+def test_zstd_output(tmp_path: pathlib.Path):
+    zstandard = pytest.importorskip("zstandard")
+    plain, packed = tmp_path/"out.csv", tmp_path/"out.csv.zst"
+    triage("data/sample.vcf", str(plain), min_dp=10, min_qual=30)
+    triage("data/sample.vcf", str(packed), min_dp=10, min_qual=30)
+    with open(packed, "rb") as fh:
+        assert zstandard.ZstdDecompressor().stream_reader(fh).read() == plain.read_bytes()
+
+def test_zstd_output_without_zstandard(tmp_path: pathlib.Path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "zstandard", None)  # makes `import zstandard` fail
+    with pytest.raises(ImportError, match="needs the 'zstandard' package"):
+        triage("data/sample.vcf", str(tmp_path/"out.csv.zst"))
+
+def _bgzf_block(data: bytes) -> bytes:
+    # One BGZF block: gzip member with FEXTRA "BC" subfield holding the block size - 1
+    comp = zlib.compressobj(6, zlib.DEFLATED, -15)
+    payload = comp.compress(data) + comp.flush()
+    bsize = 18 + len(payload) + 8
+    header = b"\x1f\x8b\x08\x04" + b"\x00" * 4 + b"\x00\xff" + struct.pack("<HBBHH", 6, 66, 67, 2, bsize - 1)
+    return header + payload + struct.pack("<II", zlib.crc32(data), len(data))
+
+# Standard 28-byte BGZF end-of-file marker block
+_BGZF_EOF = bytes.fromhex("1f8b08040000000000ff0600424302001b0003000000000000000000")
+
+def test_bgzf_detection_and_stdlib_fallback(tmp_path: pathlib.Path, monkeypatch):
+    data = pathlib.Path("data/sample.vcf").read_bytes()
+    bgz = tmp_path/"sample.vcf.gz"
+    bgz.write_bytes(_bgzf_block(data) + _BGZF_EOF)
+    plain_gz = tmp_path/"plain.vcf.gz"
+    with gzip.open(plain_gz, "wb") as fh:
+        fh.write(data)
+    assert is_bgzf(str(bgz))
+    assert not is_bgzf(str(plain_gz))
+
+    monkeypatch.setitem(sys.modules, "pysam", None)  # force the stdlib gzip fallback
+    recs = list(simple_vcf_iter(str(bgz)))
+    assert [r["POS"] for r in recs] == [1000, 2000, 3000, 4000]
+
+def test_bgzf_via_pysam_keeps_reading_past_blank_lines(tmp_path: pathlib.Path):
+    pytest.importorskip("pysam")
+    lines = pathlib.Path("data/sample.vcf").read_bytes().splitlines(keepends=True)
+    first_rec = next(i for i, line in enumerate(lines) if not line.startswith(b"#"))
+    # blank line after the first record
+    data = b"".join(lines[: first_rec + 1]) + b"\n" + b"".join(lines[first_rec + 1 :])
+    bgz = tmp_path/"blank.vcf.gz"
+    bgz.write_bytes(_bgzf_block(data) + _BGZF_EOF)
+    recs = list(simple_vcf_iter(str(bgz)))
+    assert [r["POS"] for r in recs] == [1000, 2000, 3000, 4000]
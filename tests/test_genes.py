@@ -9,3 +9,18 @@ def test_gene_filter(tmp_path: pathlib.Path):
     poses = {r["pos"] for r in rows}
     assert poses == {"1000"}  # only the GENE1 missense survives
 
+
+def test_gene_filter_uses_first_ann_entry_only(tmp_path: pathlib.Path):
+    vcf = tmp_path/"genes.vcf"
+    vcf.write_text(
+        "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\tFORMAT\tsample1\n"
+        # allowlisted gene only in a later ANN entry: dropped
+        "1\t1000\t.\tA\tG\t50\tPASS\tANN=G|missense_variant|MOD|OTHER|,G|missense_variant|MOD|GENE1|\tGT:DP\t1/1:30\n"
+        # regex metacharacters in the gene name are matched literally
+        "1\t2000\t.\tA\tG\t50\tPASS\tANN=G|missense_variant|MOD|HLA-A*02(x)|\tGT:DP\t1/1:30\n"
+        "1\t3000\t.\tA\tG\t50\tPASS\tANN=G|missense_variant|MOD|HLA-Ax02xxx|\tGT:DP\t1/1:30\n"
+    )
+    out = tmp_path/"out.csv"
+    triage(str(vcf), str(out), genes_set={"GENE1", "HLA-A*02(x)"})
+    rows = list(csv.DictReader(open(out)))
+    assert [(r["pos"], r["gene"]) for r in rows] == [("2000", "HLA-A*02(x)")]
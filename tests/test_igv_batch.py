@@ -29,3 +29,15 @@ def test_make_batch_bam_col(tmp_path: Path):
     # No snapshot lines because snapshot_dir not set
     assert "snapshot " not in txt
 
+
+def test_make_batch_uppercase_columns(tmp_path: Path):
+    # Column names are matched case-insensitively; short rows are tolerated
+    csv_path = tmp_path / "triage.csv"
+    csv_path.write_text("CHROM,POS,GENE,CONSEQUENCE\n2,500,GENE9,stop_gained\n3,700\n")
+    out = tmp_path / "igv_batch.txt"
+    n = make_igv_batch(str(csv_path), str(out), bam="/x/s.bam", flank=10, snapshot_dir="shots")
+    assert n == 2
+    txt = out.read_text()
+    assert "goto 2:490-510" in txt
+    assert "snapshot 2_500_GENE9_stop_gained.png" in txt
+    assert "snapshot 3_700.png" in txt
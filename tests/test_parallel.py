@@ -0,0 +1,38 @@
+import pathlib, random
+from src.vcf_triage import triage, triage_parallel
+
+def _write_vcf(path: pathlib.Path, n: int = 500):
+    rng = random.Random(7)
+    lines = [
+        "##fileformat=VCFv4.2\n",
+        "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\tFORMAT\tsample1\n",
+    ]
+    cons = ["missense_variant", "synonymous_variant", "stop_gained"]
+    for i in range(n):
+        af = rng.choice(["0.001", "0.005", "0.2"])
+        ann = f"G|{rng.choice(cons)}|MOD|GENE{i % 7}|||||c.{i}A>G|p.X{i}Y"
+        ref_ad, alt_ad = rng.randint(0, 30), rng.randint(0, 30)
+        lines.append(
+            f"1\t{1000 + i}\t.\tA\tG,T\t{rng.choice(['10', '50', '.'])}\t{rng.choice(['PASS', 'q10', '.'])}"
+            f"\tAF={af};ANN={ann}\tGT:AD:DP\t0/1:{ref_ad},{alt_ad}:{ref_ad + alt_ad}\n"
+        )
+    path.write_text("".join(lines))
+
+def test_parallel_matches_serial(tmp_path: pathlib.Path):
+    vcf = tmp_path/"many.vcf"
+    _write_vcf(vcf)
+    serial, parallel = tmp_path/"serial.csv", tmp_path/"parallel.csv"
+    s1, s2 = tmp_path/"s1.txt", tmp_path/"s2.txt"
+    triage(str(vcf), str(serial), genes_set={"GENE1", "GENE3"}, summary_path=str(s1))
+    triage_parallel(str(vcf), str(parallel), workers=3, genes_set={"GENE1", "GENE3"}, summary_path=str(s2), min_bytes=0)
+    assert parallel.read_bytes() == serial.read_bytes()
+    assert s2.read_text() == s1.read_text()
+    assert "Kept variants: 0" not in s1.read_text()
+
+def test_parallel_empty_vcf(tmp_path: pathlib.Path):
+    vcf = tmp_path/"empty.vcf"
+    vcf.write_bytes(b"")
+    serial, parallel = tmp_path/"serial.csv", tmp_path/"parallel.csv"
+    triage(str(vcf), str(serial))
+    triage_parallel(str(vcf), str(parallel), workers=2, min_bytes=0)
+    assert parallel.read_bytes() == serial.read_bytes()